@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import sys
 import threading
+from functools import lru_cache
 
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtCore import QSharedMemory
@@ -109,14 +110,17 @@ def main() -> int:
             listener_slot["listener"].stop()
             listener_slot["listener"] = None
 
-    def _input_devices() -> list[tuple[int, str]]:
+    # PortAudio snapshots the device list when it initializes, so re-querying on
+    # every settings open returns the same answer — enumerate once per process
+    @lru_cache(maxsize=1)
+    def _input_devices() -> tuple[tuple[int, str], ...]:
         import sounddevice as sd
 
-        return [
+        return tuple(
             (i, d["name"])
             for i, d in enumerate(sd.query_devices())
             if d["max_input_channels"] > 0
-        ]
+        )
 
     def open_settings() -> None:
         from .ui.settings import SettingsDialog
@@ -163,8 +167,9 @@ def main() -> int:
         lambda msg: tray.showMessage("Vype", msg, QSystemTrayIcon.MessageIcon.Warning, 3000)
     )
 
-    # warm the model so the first hotkey press is instant; the throwaway
-    # transcribe pays the one-time CUDA kernel-init cost (~5 s) up front
+    # load the model up front so the first hotkey press is instant. For parakeet
+    # the throwaway transcribe also pays the one-time CUDA kernel-init cost
+    # (~5 s); whisper's VAD strips this silent clip, so it warms up inside load()
     def _preload() -> None:
         try:
             import numpy as np
@@ -11,6 +11,14 @@ from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed parser/emitter when PyYAML was built with it; same safe subset
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pure-Python PyYAML build
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
 CONFIG_FILENAME = "config.yaml"
 
 
@@ -27,6 +35,7 @@ class SttConfig(_Model):
     backend: str = "parakeet"  # parakeet | whisper | openai
     device: str = "cuda"
     model: str | None = None  # backend-specific model override
+    compute_type: str | None = None  # whisper only; None = fastest the device supports
     base_url: str | None = None  # openai backend only
     api_key: str | None = None
 
@@ -90,7 +99,7 @@ def load_config(path: Path | None = None) -> Config:
         save_config(cfg, path)
         return cfg
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = yaml.load(path.read_text(encoding="utf-8"), Loader=_Loader)
         if not isinstance(data, dict):
             raise ValueError(f"config root is {type(data).__name__}, expected mapping")
         return Config.model_validate(data)
@@ -103,6 +112,6 @@ def save_config(cfg: Config, path: Path | None = None) -> None:
     path = path or config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(
-        yaml.safe_dump(cfg.model_dump(), sort_keys=False, allow_unicode=True),
+        yaml.dump(cfg.model_dump(), Dumper=_Dumper, sort_keys=False, allow_unicode=True),
         encoding="utf-8",
     )
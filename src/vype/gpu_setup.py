@@ -18,7 +18,9 @@ import os
 import shutil
 import sys
 import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable
 
@@ -26,6 +28,9 @@ logger = logging.getLogger(__name__)
 
 ORT_VERSION = "1.22.0"  # must match the onnxruntime pinned in the build venv
 
+# concurrent wheel downloads — enough to fill the link, few enough to be polite
+_DOWNLOAD_WORKERS = 3
+
 # (pypi project, exact version, wheel-member prefix filter)
 # nvrtc + nvjitlink are load-time dependencies of cublas/cudnn — without them
 # the GPU onnxruntime pybind module fails to import.
@@ -108,6 +113,89 @@ def is_installed() -> bool:
         return False
 
 
+class _DownloadProgress:
+    """Folds per-wheel byte counts from concurrent downloads into one progress bar.
+
+    Each wheel weighs equally, so small wheels finishing early still move the
+    bar. Downloads fill the first 0.85 of it; extraction, which runs as each
+    wheel lands, fills the rest.
+    """
+
+    def __init__(self, count: int, progress: Callable[[str, float], None]) -> None:
+        self._done = [0] * count
+        self._total = [0] * count
+        self._installed = 0
+        self._progress = progress
+        self._lock = threading.Lock()
+        self._last_step = -1
+
+    def start(self, index: int, total: int) -> None:
+        with self._lock:
+            self._total[index] = total
+
+    def advance(self, index: int, n: int) -> None:
+        with self._lock:
+            self._done[index] += n
+            self._report()
+
+    def finish(self, index: int) -> None:
+        with self._lock:
+            # unknown content-length: the wheel counts once it is complete
+            self._total[index] = self._done[index] = max(self._done[index], 1)
+            self._report()
+
+    def installing(self, name: str) -> None:
+        with self._lock:
+            self._progress(f"Installing {name}…", self._fraction())
+
+    def installed(self) -> None:
+        with self._lock:
+            self._installed += 1
+            self._report()
+
+    def _fraction(self) -> float:
+        downloaded = sum(
+            min(1.0, d / t) for d, t in zip(self._done, self._total, strict=True) if t
+        )
+        return (0.85 * downloaded + 0.15 * self._installed) / len(self._done)
+
+    def _report(self) -> None:
+        frac = self._fraction()
+        # report only when the bar (0..1000) would move — each call is a
+        # cross-thread Qt signal
+        step = int(frac * 1000)
+        if step == self._last_step:
+            return
+        self._last_step = step
+        done_mb, total_mb = sum(self._done) >> 20, sum(self._total) >> 20
+        self._progress(f"Downloading GPU runtime  ({done_mb} / {total_mb} MB)", frac)
+
+
+def _download_wheel(
+    client, url: str, dest: Path, index: int, tracker: _DownloadProgress,
+    cancelled: threading.Event,
+) -> None:
+    with client.stream("GET", url) as response:
+        response.raise_for_status()
+        tracker.start(index, int(response.headers.get("content-length", 0)))
+        with dest.open("wb") as f:
+            for chunk in response.iter_bytes(1 << 20):
+                if cancelled.is_set():
+                    raise RuntimeError("download cancelled")
+                f.write(chunk)
+                tracker.advance(index, len(chunk))
+    tracker.finish(index)
+
+
+def _extract_wheel(wheel_path: Path, prefix: str, dest: Path) -> None:
+    with zipfile.ZipFile(wheel_path) as wheel:
+        for member in wanted_members(wheel.namelist(), prefix):
+            target = dest / Path(member).name
+            with wheel.open(member) as src, target.open("wb") as out:
+                shutil.copyfileobj(src, out)
+    wheel_path.unlink(missing_ok=True)
+
+
 def install(progress: Callable[[str, float], None]) -> None:
     """Download and install GPU support. progress(status_text, fraction 0..1)."""
     import httpx
@@ -119,37 +207,42 @@ def install(progress: Callable[[str, float], None]) -> None:
     nvidia_dest.mkdir(parents=True, exist_ok=True)
 
     with tempfile.TemporaryDirectory(prefix="vype_gpu_") as tmp:
+        wheels = [Path(tmp) / f"{name}.whl" for name, _, _ in PACKAGES]
         with httpx.Client(timeout=60.0, follow_redirects=True) as client:
-            for i, (name, version, prefix) in enumerate(PACKAGES):
-                base_frac = i / len(PACKAGES)
-                progress(f"Fetching {name} {version}…", base_frac)
-                meta = client.get(f"https://pypi.org/pypi/{name}/{version}/json").json()
-                url = pick_wheel_url(meta, version)
-
-                wheel_path = Path(tmp) / f"{name}.whl"
-                with client.stream("GET", url) as response:
-                    response.raise_for_status()
-                    total = int(response.headers.get("content-length", 0)) or None
-                    done = 0
-                    with wheel_path.open("wb") as f:
-                        for chunk in response.iter_bytes(1 << 20):
-                            f.write(chunk)
-                            done += len(chunk)
-                            if total:
-                                frac = base_frac + 0.85 * (done / total) / len(PACKAGES)
-                                progress(
-                                    f"Downloading {name}  ({done // (1 << 20)} / {total // (1 << 20)} MB)",
-                                    frac,
-                                )
-
-                progress(f"Installing {name}…", base_frac + 0.9 / len(PACKAGES))
-                dest = capi_dest if prefix.startswith("onnxruntime") else nvidia_dest
-                with zipfile.ZipFile(wheel_path) as wheel:
-                    for member in wanted_members(wheel.namelist(), prefix):
-                        target = dest / Path(member).name
-                        with wheel.open(member) as src, target.open("wb") as out:
-                            shutil.copyfileobj(src, out)
-                wheel_path.unlink(missing_ok=True)
+            progress("Resolving packages…", 0.0)
+            urls = [
+                pick_wheel_url(
+                    client.get(f"https://pypi.org/pypi/{name}/{version}/json").json(), version
+                )
+                for name, version, _ in PACKAGES
+            ]
+
+            # the wheels are independent — fetch a few at once over the shared
+            # connection pool; a single stream rarely saturates the link
+            tracker = _DownloadProgress(len(PACKAGES), progress)
+            cancelled = threading.Event()
+            with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as pool:
+                futures = {
+                    pool.submit(_download_wheel, client, url, wheel, i, tracker, cancelled): i
+                    for i, (url, wheel) in enumerate(zip(urls, wheels, strict=True))
+                }
+                try:
+                    # take wheels in completion order: a failure surfaces at once,
+                    # and each wheel is extracted and deleted while the rest are
+                    # still downloading, so the temp dir never holds all ~1.5 GB
+                    for future in as_completed(futures):
+                        future.result()
+                        i = futures[future]
+                        name, _version, prefix = PACKAGES[i]
+                        tracker.installing(name)
+                        dest = capi_dest if prefix.startswith("onnxruntime") else nvidia_dest
+                        _extract_wheel(wheels[i], prefix, dest)
+                        tracker.installed()
+                except BaseException:
+                    cancelled.set()  # stop the other workers instead of finishing GBs
+                    for future in futures:
+                        future.cancel()
+                    raise
 
     _marker().write_text(f"ort=={ORT_VERSION}\n", encoding="utf-8")
     progress("GPU support installed", 1.0)
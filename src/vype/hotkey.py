@@ -12,6 +12,7 @@ unit-testable without hooking the real keyboard.
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Callable
 
 logger = logging.getLogger(__name__)
@@ -29,8 +30,10 @@ _CANONICAL = {
 }
 
 
+@lru_cache(maxsize=256)  # runs on every global key event; key names are a small set
 def _canonical(name: str) -> str:
-    return _CANONICAL.get(name.lower(), name.lower())
+    lowered = name.lower()
+    return _CANONICAL.get(lowered, lowered)
 
 
 class HotkeyListener:
@@ -6,12 +6,90 @@ user made in the meantime is never clobbered.
 
 from __future__ import annotations
 
+import ctypes
 import logging
 import threading
+from ctypes import wintypes
 from typing import Callable, Protocol
 
 logger = logging.getLogger(__name__)
 
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_VK_CONTROL = 0x11
+_VK_V = 0x56
+# set-1 scan codes, sent alongside the VKs — RDP/VM clients, consoles and some
+# games read the scan code and ignore the virtual key
+_SC_CONTROL = 0x1D
+_SC_V = 0x2F
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    # never sent — only here so the union (and INPUT) has the size Win32 expects
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+def _key_input(vk: int, scan: int, up: bool = False) -> _INPUT:
+    flags = _KEYEVENTF_KEYUP if up else 0
+    return _INPUT(
+        type=_INPUT_KEYBOARD,
+        u=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, wScan=scan, dwFlags=flags)),
+    )
+
+
+# Ctrl down, V down, V up, Ctrl up — built once, sent as one SendInput batch
+_CTRL_V_INPUTS = (_INPUT * 4)(
+    _key_input(_VK_CONTROL, _SC_CONTROL),
+    _key_input(_VK_V, _SC_V),
+    _key_input(_VK_V, _SC_V, up=True),
+    _key_input(_VK_CONTROL, _SC_CONTROL, up=True),
+)
+
+# Our own handle rather than ctypes.windll.user32: pyperclip sets prototypes on
+# the shared one, and ours must not fight with them
+try:
+    _user32 = ctypes.WinDLL("user32")
+    _user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+    _user32.SendInput.restype = wintypes.UINT
+except (AttributeError, OSError):  # not Windows
+    _user32 = None
+
+
+def _send_ctrl_v() -> bool:
+    """Paste via a single Win32 SendInput call. False if unavailable or refused."""
+    if _user32 is None:
+        return False
+    try:
+        sent = _user32.SendInput(len(_CTRL_V_INPUTS), _CTRL_V_INPUTS, ctypes.sizeof(_INPUT))
+    except Exception:
+        return False
+    return sent == len(_CTRL_V_INPUTS)
+
 
 class Clipboard(Protocol):
     def read(self) -> str: ...
@@ -36,6 +114,9 @@ class PyperclipClipboard:
 
 class KeyboardKeys:
     def send(self, combo: str) -> None:
+        # the paste chord skips keyboard's per-call hotkey-string parsing
+        if combo == "ctrl+v" and _send_ctrl_v():
+            return
         import keyboard
 
         keyboard.send(combo)
@@ -61,8 +142,8 @@ class Injector:
         self._schedule = schedule
 
     def paste(self, text: str) -> None:
-        if not text:
-            return
+        if not text or text.isspace():
+            return  # nothing visible to paste — skip the clipboard round-trip
         try:
             previous: str | None = self._clipboard.read()
         except Exception as exc:
@@ -15,6 +15,7 @@ from typing import Callable, Optional
 from .cleanup import CleanupUnavailable
 from .config import Config
 from .fsm import Command, DictationFSM, State
+from .recorder import trim_silence
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +126,7 @@ class Pipeline:
                 logger.debug("Discarding %.2f s utterance (below minimum)", duration_s)
                 return
 
+            audio = trim_silence(audio, self._recorder_sample_rate())
             with self._engine_lock:
                 raw = self._transcriber.transcribe(audio)
             if not raw:
@@ -164,7 +166,9 @@ class Pipeline:
         if not self._engine_lock.acquire(blocking=False):
             return  # final pass or previous tick still running — skip, never queue
         try:
-            text = self._transcriber.transcribe(snapshot)
+            text = self._transcriber.transcribe(
+                trim_silence(snapshot, self._recorder_sample_rate())
+            )
         except Exception as exc:
             logger.debug("Preview tick failed: %s", exc)
             return
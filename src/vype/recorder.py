@@ -16,12 +16,47 @@ import numpy as np
 # visibly alive instead of rendering as flat dots.
 _LEVEL_FULL_SCALE_RMS = 0.08
 
+# Returned on every empty path (stop with no audio, snapshot before the first
+# chunk). Read-only so a caller can never mutate the shared instance.
+_EMPTY_F32 = np.zeros(0, dtype=np.float32)
+_EMPTY_F32.flags.writeable = False
+
+# Initial capture buffer per session; doubles if a long dictation outgrows it.
+_INITIAL_BUFFER_S = 30
+
+# Silence trim: 20 ms frames, an RMS floor well under quiet speech, and a
+# generous margin so soft word onsets/offsets are never clipped.
+_TRIM_FRAME_S = 0.02
+_TRIM_RMS = 0.005
+_TRIM_PAD_S = 0.25
+
+
+def trim_silence(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Drop leading/trailing near-silence so the encoder only sees the speech span.
+
+    Returns a view. If no frame clears the floor the audio is returned as-is —
+    a quiet mic should still reach the model rather than be discarded here.
+    """
+    frame = int(sample_rate * _TRIM_FRAME_S)
+    n = audio.size // frame if frame else 0
+    if n == 0:
+        return audio
+    frames = audio[: n * frame].reshape(n, frame)
+    rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame)
+    loud = np.flatnonzero(rms > _TRIM_RMS)
+    if loud.size == 0:
+        return audio
+    pad = int(_TRIM_PAD_S * sample_rate)
+    start = max(0, int(loud[0]) * frame - pad)
+    end = min(audio.size, (int(loud[-1]) + 1) * frame + pad)
+    return audio[start:end]
+
 
 def _sounddevice_stream_factory(samplerate: int, channels: int, device, callback):
     import sounddevice as sd
 
     def sd_callback(indata, frames, time_info, status):
-        callback(indata[:, 0].copy())
+        callback(indata[:, 0])  # the recorder copies into its own buffer
 
     return sd.InputStream(
         samplerate=samplerate,
@@ -43,7 +78,9 @@ class Recorder:
         self._device_id = device_id
         self._stream_factory = stream_factory
         self._stream = None
-        self._chunks: list[np.ndarray] = []
+        # one contiguous append-only buffer: samples [0, _n) are valid
+        self._buf = _EMPTY_F32
+        self._n = 0
         self._lock = threading.Lock()
         self._level = 0.0
         self._recording = False
@@ -69,7 +106,10 @@ class Recorder:
         if self._recording:
             return
         with self._lock:
-            self._chunks = []
+            # fresh buffer each session: views handed out by stop()/snapshot()
+            # of the previous one must never be overwritten
+            self._buf = np.empty(_INITIAL_BUFFER_S * self._sample_rate, dtype=np.float32)
+            self._n = 0
         self._level = 0.0
         self._stream = self._stream_factory(
             self._sample_rate, 1, self._device_id, self._on_audio
@@ -87,28 +127,47 @@ class Recorder:
         self._recording = False
         self._level = 0.0
         with self._lock:
-            chunks, self._chunks = self._chunks, []
-        if not chunks:
-            return np.zeros(0, dtype=np.float32)
-        return np.concatenate(chunks)
+            buf, n = self._buf, self._n
+            self._buf, self._n = _EMPTY_F32, 0
+        if n == 0:
+            return _EMPTY_F32
+        audio = buf[:n]
+        audio.flags.writeable = False  # like _EMPTY_F32: consumers must copy to modify
+        return audio
 
     def snapshot(self, last_s: Optional[float] = None) -> np.ndarray:
-        """Copy of the audio so far (optionally only the trailing window).
+        """Read-only view of the audio so far (optionally only the trailing window).
 
-        Does not consume the buffer — used by the live-preview loop.
+        Does not consume the buffer — used by the live-preview loop. No copy is
+        made: the buffer is append-only, so samples already written never change,
+        and growing it moves to a new array while this view keeps the old one.
         """
         with self._lock:
-            if not self._chunks:
-                return np.zeros(0, dtype=np.float32)
-            audio = np.concatenate(self._chunks)
-        if last_s is not None:
-            audio = audio[-int(last_s * self._sample_rate):]
-        return audio
+            buf, n = self._buf, self._n
+        if n == 0:
+            return _EMPTY_F32
+        want = int(last_s * self._sample_rate) if last_s is not None else 0
+        start = n - want if 0 < want < n else 0
+        view = buf[start:n]
+        view.flags.writeable = False
+        return view
 
     def _on_audio(self, chunk: np.ndarray) -> None:
         with self._lock:
-            self._chunks.append(chunk)
-        rms = float(np.sqrt(np.mean(chunk**2))) if chunk.size else 0.0
+            end = self._n + chunk.size
+            if end > self._buf.size:
+                # Trade-off: this allocates and copies the recording so far inside
+                # the PortAudio callback. It only happens at 30 s, 60 s, 120 s, …
+                # and the first regrow moves ~2 MB (well under a millisecond)
+                # against a block period of tens of ms; growing ahead on a helper
+                # thread would avoid it but isn't worth a thread per session.
+                grown = np.empty(max(end, 2 * self._buf.size), dtype=np.float32)
+                grown[: self._n] = self._buf[: self._n]
+                self._buf = grown
+            self._buf[self._n : end] = chunk
+            self._n = end
+        # dot product: one BLAS pass, no chunk-sized temporary for chunk**2
+        rms = float(np.sqrt(np.dot(chunk, chunk) / chunk.size)) if chunk.size else 0.0
         # square-root curve: perceptually livelier response at quiet levels
         target = min(1.0, (rms / _LEVEL_FULL_SCALE_RMS) ** 0.5)
         # light exponential smoothing so the pill's bars don't flicker
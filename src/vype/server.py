@@ -33,11 +33,14 @@ def _decode_wav(data: bytes) -> np.ndarray:
         raise ValueError(f"not a valid WAV file: {exc}") from exc
 
     if width == 2:
-        audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+        dtype, full_scale = np.int16, 32768.0
     elif width == 4:
-        audio = np.frombuffer(frames, dtype=np.int32).astype(np.float32) / 2147483648.0
+        dtype, full_scale = np.int32, 2147483648.0
     else:
         raise ValueError(f"unsupported sample width: {width}")
+    # one float32 copy, scaled in place
+    audio = np.frombuffer(frames, dtype=dtype).astype(np.float32)
+    audio *= np.float32(1.0 / full_scale)
 
     if channels > 1:
         audio = audio.reshape(-1, channels).mean(axis=1)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 
 import numpy as np
 
@@ -12,22 +13,80 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL = "large-v3-turbo"
 
+# fastest first; CTranslate2 raises ValueError for a type the device can't run
+# efficiently (e.g. float16 on pre-Volta GPUs), so fall through to the next
+_COMPUTE_TYPES = {
+    "cuda": ("float16", "int8_float16", "int8", "float32"),
+    "cpu": ("int8", "float32"),
+}
+
 
 class WhisperTranscriber:
     def __init__(self, cfg: SttConfig) -> None:
         self._model_id = cfg.model or DEFAULT_MODEL
         self._device = cfg.device
+        self._compute_type = cfg.compute_type
         self._model = None
+        self.compute_type: str | None = None  # resolved at load()
 
     def load(self) -> None:
         if self._model is not None:
             return
         from faster_whisper import WhisperModel
 
-        compute_type = "float16" if self._device.lower() == "cuda" else "int8"
+        device = "cuda" if self._device.lower() == "cuda" else "cpu"
         logger.info("Loading faster-whisper %s (device=%s)", self._model_id, self._device)
-        self._model = WhisperModel(self._model_id, device=self._device, compute_type=compute_type)
-        logger.info("faster-whisper model loaded")
+        candidates = _COMPUTE_TYPES[device]
+        if self._compute_type:  # user's choice first, the device ladder as fallback
+            candidates = (self._compute_type,) + tuple(
+                c for c in candidates if c != self._compute_type
+            )
+        # CTranslate2 defaults to 4 intra-op threads; on CPU use the cores we have
+        # (capped — beyond ~8 the decoder stops scaling). Calls are serialized by
+        # the pipeline's engine lock, so extra num_workers would sit idle.
+        threads = min(8, os.cpu_count() or 4) if device == "cpu" else 0
+        for compute_type in candidates:
+            try:
+                model = WhisperModel(
+                    self._model_id,
+                    device=self._device,
+                    compute_type=compute_type,
+                    cpu_threads=threads,
+                )
+            except ValueError as exc:
+                if compute_type == candidates[-1]:
+                    raise
+                # a rejected stt.compute_type must be visible, not silently replaced
+                log = logger.warning if compute_type == self._compute_type else logger.info
+                log("compute_type %s unsupported (%s) — trying next", compute_type, exc)
+                continue
+            self.compute_type = compute_type
+            break
+        self._model = model
+        logger.info("faster-whisper model loaded (compute_type=%s)", self.compute_type)
+        self._warm_up(model)
+
+    @staticmethod
+    def _warm_up(model) -> None:
+        """Run the encoder and decoder once so the first utterance doesn't pay kernel init.
+
+        A silent clip through transcribe() is no warm-up here: the VAD filter
+        strips it and the model never runs. Bypass VAD on a quiet tone + noise,
+        and cap the decode — greedy decoding of noise can otherwise hallucinate
+        up to the 448-token limit. Best-effort: the model is already loaded, so a
+        failure here only costs first-utterance latency.
+        """
+        t = np.arange(16000, dtype=np.float32) / 16000  # 1 s at 16 kHz
+        noise = np.random.default_rng(0).standard_normal(t.size)
+        audio = (0.05 * np.sin(2 * np.pi * 220 * t) + 0.01 * noise).astype(np.float32)
+        try:
+            segments, _info = model.transcribe(
+                audio, vad_filter=False, beam_size=1, without_timestamps=True, max_new_tokens=8
+            )
+            for _ in segments:  # the generator is lazy — decoding happens here
+                pass
+        except Exception as exc:
+            logger.warning("faster-whisper warm-up failed (%s) — first utterance may be slow", exc)
 
     def transcribe(self, audio: np.ndarray) -> str:
         if audio.size == 0:
@@ -53,8 +53,10 @@ class CaptionBubble(QWidget):
         if not self._recording or not text:
             return
         # show the tail — the words just spoken — capped to ~3 lines
-        self._label.setText(text[-220:])
-        self.adjustSize()
+        tail = text[-220:]
+        if tail != self._label.text():  # preview often repeats; skip the word-wrap relayout
+            self._label.setText(tail)
+            self.adjustSize()
         self._reposition()
         self.show()
 
@@ -25,10 +25,38 @@ class _GUITHREADINFO(ctypes.Structure):
     ]
 
 
+_user32 = None
+
+
+def _get_user32():
+    """A private user32 handle with prototypes declared once.
+
+    Without restype, ctypes treats every return as a C int, which truncates
+    64-bit HWNDs; without argtypes each call takes the generic conversion path.
+    A private WinDLL keeps these prototypes from leaking into the shared
+    ctypes.windll.user32 that other libraries configure their own way.
+    """
+    global _user32
+    if _user32 is None:
+        user32 = ctypes.WinDLL("user32")
+        user32.GetForegroundWindow.argtypes = []
+        user32.GetForegroundWindow.restype = wintypes.HWND
+        user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+        user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+        user32.GetGUIThreadInfo.argtypes = [wintypes.DWORD, ctypes.POINTER(_GUITHREADINFO)]
+        user32.GetGUIThreadInfo.restype = wintypes.BOOL
+        user32.ClientToScreen.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.POINT)]
+        user32.ClientToScreen.restype = wintypes.BOOL
+        user32.GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+        user32.GetCursorPos.restype = wintypes.BOOL
+        _user32 = user32
+    return _user32
+
+
 def caret_screen_point() -> tuple[int, int] | None:
     """Screen coordinates just below the text caret, or None if unavailable."""
     try:
-        user32 = ctypes.windll.user32
+        user32 = _get_user32()
         hwnd = user32.GetForegroundWindow()
         if not hwnd:
             return None
@@ -51,7 +79,7 @@ def caret_screen_point() -> tuple[int, int] | None:
 def mouse_screen_point() -> tuple[int, int] | None:
     try:
         point = wintypes.POINT()
-        ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
+        _get_user32().GetCursorPos(ctypes.byref(point))
         return point.x, point.y
     except Exception:
         return None
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import math
 import time
+from collections import deque
 
 from PySide6.QtCore import (
     QEasingCurve,
@@ -60,9 +61,10 @@ class Pill(QWidget):
         self._on_right_click = on_right_click
 
         self._state = "idle"
-        self._levels = [0.0] * _BAR_COUNT
+        self._levels = deque([0.0] * _BAR_COUNT, maxlen=_BAR_COUNT)
         self._record_started = 0.0
         self._pulse = 0.0
+        self._timer_font = QFont("Segoe UI", 8)  # reused by every 50 ms repaint
 
         self._anim = QPropertyAnimation(self, b"geometry")
         self._anim.setDuration(180)
@@ -83,7 +85,7 @@ class Pill(QWidget):
         self._state = state
         if self._is_recording() and not was_recording:
             self._record_started = time.monotonic()
-            self._levels = [0.0] * _BAR_COUNT
+            self._levels = deque([0.0] * _BAR_COUNT, maxlen=_BAR_COUNT)
         self._animate_to(self._target_rect())
         self.update()
 
@@ -122,8 +124,7 @@ class Pill(QWidget):
 
     def _tick(self) -> None:
         if self._is_recording():
-            self._levels.pop(0)
-            self._levels.append(float(self._level_provider()))
+            self._levels.append(float(self._level_provider()))  # maxlen drops the oldest
             self.update()
         elif self._state == "processing":
             self._pulse = (self._pulse + 0.08) % 1.0
@@ -166,7 +167,7 @@ class Pill(QWidget):
             p.drawRoundedRect(x0 + i * (bar_w + gap), cy - bar_h // 2, bar_w, bar_h, 2, 2)
 
         p.setPen(_TEXT_DIM)
-        p.setFont(QFont("Segoe UI", 8))
+        p.setFont(self._timer_font)
         elapsed = int(time.monotonic() - self._record_started)
         suffix = " 🔒" if self._state == "recording-locked" else ""
         p.drawText(
@@ -7,7 +7,7 @@ and the combo is finalized when the first key is released.
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Sequence
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor, QFont, QPainter
@@ -212,7 +212,7 @@ class SettingsDialog(QDialog):
     def __init__(
         self,
         cfg: Config,
-        input_devices: list[tuple[int, str]],
+        input_devices: Sequence[tuple[int, str]],
         on_save: Callable[[], None],
     ) -> None:
         super().__init__(
@@ -367,6 +367,7 @@ class SettingsDialog(QDialog):
 
     def _save(self) -> None:
         cfg = self._cfg
+        before = cfg.model_dump()
         cfg.hotkey.key = self._hotkey.key
         cfg.hotkey.tap_threshold_ms = self._tap_ms.value()
         cfg.audio.device_id = self._mic.currentData()
@@ -377,8 +378,9 @@ class SettingsDialog(QDialog):
         cfg.cleanup.base_url = self._cleanup_url.text().strip()
         cfg.cleanup.model = self._cleanup_model.text().strip()
         cfg.cleanup.api_key = self._cleanup_key.text().strip() or None
-        save_config(cfg)
-        self._on_save()
+        if cfg.model_dump() != before:  # Save with no edits is just Close — no rewrite/rebuild
+            save_config(cfg)
+            self._on_save()
         self.accept()
 
     def reject(self) -> None:
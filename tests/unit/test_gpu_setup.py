@@ -1,8 +1,19 @@
-"""GPU setup: wheel selection and payload filtering (pure logic)."""
+"""GPU setup: wheel selection, payload filtering, and the download/extract flow."""
+
+import io
+import threading
+import zipfile
 
 import pytest
 
-from vype.gpu_setup import ORT_VERSION, PACKAGES, pick_wheel_url, wanted_members
+import vype.gpu_setup as gpu_setup
+from vype.gpu_setup import (
+    ORT_VERSION,
+    PACKAGES,
+    _DownloadProgress,
+    pick_wheel_url,
+    wanted_members,
+)
 
 
 def test_pick_wheel_prefers_win_amd64():
@@ -87,3 +98,187 @@ def test_onnxruntime_gpu_pin_matches_bundled_cpu_version():
     """The GPU swap only works when versions are identical — guard the pin."""
     gpu_pin = next(v for name, v, _ in PACKAGES if name == "onnxruntime-gpu")
     assert gpu_pin == ORT_VERSION
+
+
+def test_download_progress_combines_concurrent_wheels():
+    calls = []
+    tracker = _DownloadProgress(2, lambda text, frac: calls.append(frac))
+    tracker.start(0, 100)
+    tracker.start(1, 300)
+    tracker.advance(0, 100)  # wheel 0 done → half of the download share
+    assert calls[-1] == pytest.approx(0.85 * 0.5)
+    tracker.advance(1, 150)
+    assert calls[-1] == pytest.approx(0.85 * 0.75)
+    tracker.advance(1, 150)
+    assert calls[-1] == pytest.approx(0.85)
+
+
+def test_download_progress_throttles_to_bar_steps():
+    calls = []
+    tracker = _DownloadProgress(1, lambda text, frac: calls.append(frac))
+    tracker.start(0, 1_000_000)
+    for _ in range(1000):
+        tracker.advance(0, 1)  # far below one bar step (1/1000) per call
+    assert len(calls) == 1
+
+
+def test_download_progress_unknown_length_counts_on_finish():
+    calls = []
+    tracker = _DownloadProgress(1, lambda text, frac: calls.append(frac))
+    tracker.start(0, 0)
+    tracker.advance(0, 500)
+    assert calls[-1] == 0.0
+    tracker.finish(0)
+    assert calls[-1] == pytest.approx(0.85)
+
+
+# ── install(): concurrent download + streaming extraction ───────────────────
+
+
+def _wheel_bytes(member: str) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr(member, b"dll")
+    return buf.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, body, headers=None, error=None) -> None:
+        self._body = body  # callable → iterator of byte chunks
+        self.headers = headers or {}
+        self._error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def iter_bytes(self, size):
+        yield from self._body()
+
+
+class FakeClient:
+    """Stands in for httpx.Client; `wheels` maps package name → FakeResponse factory."""
+
+    wheels: dict = {}
+
+    def __init__(self, **kwargs) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, url):
+        name = url.split("/pypi/")[1].split("/")[0]
+
+        class Meta:
+            @staticmethod
+            def json():
+                return {"url": f"https://files.example/{name}.whl"}
+
+        return Meta()
+
+    def stream(self, method, url):
+        name = url.rsplit("/", 1)[1].removesuffix(".whl")
+        return self.wheels[name]()
+
+
+@pytest.fixture()
+def fake_install(tmp_path, monkeypatch):
+    import httpx
+
+    (tmp_path / "onnxruntime" / "capi").mkdir(parents=True)
+    monkeypatch.setattr(gpu_setup, "_internal_dir", lambda: tmp_path)
+    monkeypatch.setattr(gpu_setup, "pick_wheel_url", lambda meta, version: meta["url"])
+    monkeypatch.setattr(
+        gpu_setup,
+        "PACKAGES",
+        [("pkg-a", "1", "nvidia/"), ("pkg-b", "1", "nvidia/"), ("pkg-c", "1", "nvidia/")],
+    )
+    monkeypatch.setattr(httpx, "Client", FakeClient)
+    monkeypatch.setattr(FakeClient, "wheels", {})
+    return tmp_path
+
+
+def test_install_fails_fast_and_cancels_other_downloads(fake_install, monkeypatch):
+    import httpx
+
+    # grab install()'s cancel event so the slow bodies can block on it
+    cancel_events = []
+    real_download = gpu_setup._download_wheel
+
+    def spy_download(client, url, dest, index, tracker, cancelled):
+        cancel_events.append(cancelled)
+        real_download(client, url, dest, index, tracker, cancelled)
+
+    monkeypatch.setattr(gpu_setup, "_download_wheel", spy_download)
+    saw_cancel = {}
+    streamed = {"pkg-a": 0, "pkg-b": 0}
+
+    def slow(name):
+        def body():
+            # stall until install() gives up on the failed wheel; the timeout
+            # only guards against a hang, the asserts don't depend on it
+            saw_cancel[name] = cancel_events[0].wait(timeout=10)
+            for _ in range(500):
+                streamed[name] += 1
+                yield b"x" * 10
+
+        return lambda: FakeResponse(body, {"content-length": "5000"})
+
+    error = httpx.HTTPError("boom")
+    FakeClient.wheels.update(
+        {
+            "pkg-a": slow("pkg-a"),
+            "pkg-b": slow("pkg-b"),
+            "pkg-c": lambda: FakeResponse(lambda: iter(()), error=error),
+        }
+    )
+    with pytest.raises(httpx.HTTPError, match="boom"):
+        gpu_setup.install(lambda text, frac: None)
+    assert saw_cancel == {"pkg-a": True, "pkg-b": True}
+    assert streamed == {"pkg-a": 1, "pkg-b": 1}  # refused after the first chunk
+    assert not gpu_setup._marker().exists()
+
+
+def test_install_extracts_each_wheel_as_it_lands(fake_install, monkeypatch):
+    nvidia = fake_install / "nvidia_dlls"
+    a_extracted = threading.Event()
+    real_extract = gpu_setup._extract_wheel
+
+    def spy_extract(wheel_path, prefix, dest):
+        real_extract(wheel_path, prefix, dest)
+        if wheel_path.stem == "pkg-a":
+            a_extracted.set()
+
+    monkeypatch.setattr(gpu_setup, "_extract_wheel", spy_extract)
+    seen_a_extracted = []
+
+    def wait_for_a():
+        # pkg-b only finishes once pkg-a is already extracted — i.e. extraction
+        # doesn't wait for every download to complete
+        seen_a_extracted.append(a_extracted.wait(timeout=10))
+        yield _wheel_bytes("nvidia/b/bin/b.dll")
+
+    FakeClient.wheels.update(
+        {
+            "pkg-a": lambda: FakeResponse(lambda: iter([_wheel_bytes("nvidia/a/bin/a.dll")])),
+            "pkg-b": lambda: FakeResponse(wait_for_a),
+            "pkg-c": lambda: FakeResponse(lambda: iter([_wheel_bytes("nvidia/c/bin/c.dll")])),
+        }
+    )
+    fracs = []
+    gpu_setup.install(lambda text, frac: fracs.append(frac))
+    assert seen_a_extracted == [True]
+    assert {p.name for p in nvidia.glob("*.dll")} == {"a.dll", "b.dll", "c.dll"}
+    assert gpu_setup._marker().exists()
+    assert fracs == sorted(fracs)  # the bar never moves backwards
+    assert fracs[-1] == 1.0
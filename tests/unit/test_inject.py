@@ -1,6 +1,12 @@
 """Injector: clipboard snapshot → set → paste → conditional restore."""
 
-from vype.inject import Injector
+import sys
+import types
+
+import pytest
+
+import vype.inject as inject
+from vype.inject import Injector, KeyboardKeys
 
 
 class FakeClipboard:
@@ -74,6 +80,14 @@ def test_empty_text_is_noop():
     assert sched.pending == []
 
 
+def test_whitespace_only_text_is_noop():
+    inj, clip, keys, sched = make()
+    inj.paste("  \n")
+    assert clip.writes == []
+    assert keys.sent == []
+    assert sched.pending == []
+
+
 def test_clipboard_read_failure_still_pastes():
     inj, clip, keys, sched = make()
     clip.read = lambda: (_ for _ in ()).throw(RuntimeError("clipboard locked"))
@@ -82,3 +96,40 @@ def test_clipboard_read_failure_still_pastes():
     assert keys.sent == ["ctrl+v"]
     sched.fire()  # nothing to restore; must not raise
     assert clip.value == "hello"
+
+
+# ── KeyboardKeys: SendInput fast path for the paste chord ───────────────────
+
+
+@pytest.fixture()
+def fake_keyboard(monkeypatch):
+    sent = []
+    monkeypatch.setitem(sys.modules, "keyboard", types.SimpleNamespace(send=sent.append))
+    return sent
+
+
+def test_ctrl_v_uses_sendinput_when_it_succeeds(monkeypatch, fake_keyboard):
+    calls = []
+    monkeypatch.setattr(inject, "_send_ctrl_v", lambda: calls.append(1) or True)
+    KeyboardKeys().send("ctrl+v")
+    assert calls == [1]
+    assert fake_keyboard == []
+
+
+def test_ctrl_v_falls_back_to_keyboard_when_sendinput_fails(monkeypatch, fake_keyboard):
+    monkeypatch.setattr(inject, "_send_ctrl_v", lambda: False)
+    KeyboardKeys().send("ctrl+v")
+    assert fake_keyboard == ["ctrl+v"]
+
+
+def test_other_combos_never_go_through_sendinput(monkeypatch, fake_keyboard):
+    calls = []
+    monkeypatch.setattr(inject, "_send_ctrl_v", lambda: calls.append(1) or True)
+    KeyboardKeys().send("ctrl+shift+v")
+    assert calls == []
+    assert fake_keyboard == ["ctrl+shift+v"]
+
+
+def test_ctrl_v_inputs_carry_scan_codes():
+    keys = [(i.u.ki.wVk, i.u.ki.wScan, i.u.ki.dwFlags) for i in inject._CTRL_V_INPUTS]
+    assert keys == [(0x11, 0x1D, 0), (0x56, 0x2F, 0), (0x56, 0x2F, 2), (0x11, 0x1D, 2)]
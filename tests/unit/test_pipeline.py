@@ -216,3 +216,44 @@ def test_preview_skips_tiny_snapshots(fakes):
     p.press(now=0.0)
     p.preview_tick()
     assert fakes["transcriber"].calls == []
+
+
+# ── Silence trim before transcription ────────────────────────────────────────
+
+def padded_speech(lead_s=2.0, speech_s=1.0, tail_s=2.0):
+    """Silence · 'speech' (constant 0.1) · silence — what a hold-to-talk clip looks like."""
+    audio = np.zeros(int((lead_s + speech_s + tail_s) * SR), dtype=np.float32)
+    audio[int(lead_s * SR) : int((lead_s + speech_s) * SR)] = 0.1
+    return audio
+
+
+def test_final_pass_receives_trimmed_audio(fakes):
+    fakes["recorder"].audio = padded_speech()
+    p = make_pipeline(fakes)
+    hold_cycle(p)
+    sent = fakes["transcriber"].calls[0]
+    assert sent.shape == (SR + 2 * int(0.25 * SR),)  # speech + 250 ms margin each side
+    assert sent.max() == pytest.approx(0.1)
+
+
+def test_preview_receives_trimmed_audio(fakes):
+    cfg = Config()
+    cfg.ui.preview_window_s = 5.0
+    fakes["recorder"].audio = padded_speech()
+    p = make_pipeline(fakes, cfg=cfg)
+    p.press(now=0.0)
+    p.preview_tick()
+    assert fakes["transcriber"].calls[0].shape == (SR + 2 * int(0.25 * SR),)
+
+
+def test_all_quiet_audio_reaches_transcriber_unchanged(fakes):
+    quiet = np.full(3 * SR, 0.001, dtype=np.float32)  # below the trim floor everywhere
+    fakes["recorder"].audio = quiet
+    p = make_pipeline(fakes)
+    p.press(now=0.0)
+    p.preview_tick()
+    p.release(now=1.0)
+    preview, final = fakes["transcriber"].calls
+    assert final is quiet
+    assert preview.shape == quiet.shape
+    np.testing.assert_array_equal(preview, quiet)
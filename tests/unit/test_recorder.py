@@ -3,7 +3,7 @@
 import numpy as np
 import pytest
 
-from vype.recorder import Recorder
+from vype.recorder import Recorder, trim_silence
 
 
 class FakeStream:
@@ -82,6 +82,46 @@ def test_snapshot_returns_tail_window(recorder):
     assert recorder.stop().shape == (64000,)
 
 
+def test_snapshot_window_not_aligned_to_chunks(recorder):
+    recorder.start()
+    stream = recorder._test_streams[0]
+    for v in (0.1, 0.2, 0.3, 0.4, 0.5):
+        stream.callback(chunk(v))  # 0.1 s each
+    snap = recorder.snapshot(last_s=0.25)
+    assert snap.shape == (4000,)
+    assert snap[0] == pytest.approx(0.3)
+    assert snap[-1] == pytest.approx(0.5)
+
+
+def test_buffer_grows_past_initial_capacity(recorder, monkeypatch):
+    import vype.recorder as recorder_mod
+
+    monkeypatch.setattr(recorder_mod, "_INITIAL_BUFFER_S", 1)
+    recorder.start()
+    stream = recorder._test_streams[0]
+    stream.callback(chunk(0.1, n=12000))
+    early = recorder.snapshot()
+    stream.callback(chunk(0.2, n=12000))  # 1.5 s total — forces a regrow
+    assert early.shape == (12000,)
+    assert early[-1] == pytest.approx(0.1)  # earlier views survive the regrow
+    audio = recorder.stop()
+    assert audio.shape == (24000,)
+    assert audio[11999] == pytest.approx(0.1)
+    assert audio[12000] == pytest.approx(0.2)
+
+
+def test_returned_audio_is_read_only(recorder):
+    recorder.start()
+    recorder._test_streams[0].callback(chunk(0.1))
+    snap = recorder.snapshot(last_s=0.05)
+    with pytest.raises(ValueError):
+        snap *= 2  # would silently rewrite the live recording
+    audio = recorder.stop()
+    with pytest.raises(ValueError):
+        audio[0] = 1.0
+    assert audio[0] == pytest.approx(0.1)
+
+
 def test_snapshot_full_when_no_window(recorder):
     recorder.start()
     recorder._test_streams[0].callback(chunk(0.1, n=16000))
@@ -105,3 +145,17 @@ def test_is_recording_flag(recorder):
     assert recorder.is_recording
     recorder.stop()
     assert not recorder.is_recording
+
+
+def test_trim_silence_keeps_padded_speech_span():
+    sr = 16000
+    audio = np.zeros(3 * sr, dtype=np.float32)
+    audio[sr : 2 * sr] = 0.1  # 1 s of "speech" between two 1 s silences
+    trimmed = trim_silence(audio, sr)
+    assert trimmed.size == sr + 2 * int(0.25 * sr)
+    assert trimmed.max() == pytest.approx(0.1)
+
+
+def test_trim_silence_leaves_all_quiet_audio_alone():
+    audio = np.full(16000, 0.001, dtype=np.float32)
+    assert trim_silence(audio, 16000) is audio
@@ -1,10 +1,13 @@
 """STT factory + OpenAI-compatible API backend (the only unit-testable backend).
 
 Parakeet / faster-whisper backends are exercised by integration tests
-(pytest -m gpu) — here we only verify the factory routes to them lazily.
+(pytest -m gpu) — here we only verify the factory routes to them lazily, and
+the whisper compute-type fallback against a fake faster_whisper module.
 """
 
 import io
+import sys
+import types
 import wave
 
 import httpx
@@ -45,6 +48,117 @@ def test_factory_routes_whisper(monkeypatch):
     assert isinstance(t, Marker)
 
 
+class FakeWhisperModel:
+    """faster_whisper.WhisperModel stand-in: rejects compute types in `unsupported`."""
+
+    unsupported: set = set()
+    tried: list = []
+    transcribe_kwargs: list = []
+    transcribe_error: Exception | None = None
+
+    def __init__(self, model_id, device, compute_type, cpu_threads):
+        type(self).tried.append(compute_type)
+        if compute_type in self.unsupported:
+            raise ValueError(f"{compute_type} not supported")
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+
+    def transcribe(self, audio, **kwargs):
+        type(self).transcribe_kwargs.append(kwargs)
+        if self.transcribe_error is not None:
+            raise self.transcribe_error
+        return iter(()), None
+
+
+@pytest.fixture()
+def fake_whisper(monkeypatch):
+    monkeypatch.setattr(FakeWhisperModel, "unsupported", set())
+    monkeypatch.setattr(FakeWhisperModel, "tried", [])
+    monkeypatch.setattr(FakeWhisperModel, "transcribe_kwargs", [])
+    monkeypatch.setattr(FakeWhisperModel, "transcribe_error", None)
+    module = types.SimpleNamespace(WhisperModel=FakeWhisperModel)
+    monkeypatch.setitem(sys.modules, "faster_whisper", module)
+    return FakeWhisperModel
+
+
+def test_whisper_falls_back_through_compute_types(fake_whisper):
+    from vype.stt.whisper import WhisperTranscriber
+
+    fake_whisper.unsupported = {"float16", "int8_float16"}
+    t = WhisperTranscriber(SttConfig(backend="whisper", device="cuda"))
+    t.load()
+    assert fake_whisper.tried == ["float16", "int8_float16", "int8"]
+    assert t.compute_type == "int8"
+    assert t._model.compute_type == "int8"
+
+
+def test_whisper_cpu_prefers_int8(fake_whisper):
+    from vype.stt.whisper import WhisperTranscriber
+
+    t = WhisperTranscriber(SttConfig(backend="whisper", device="cpu"))
+    t.load()
+    assert fake_whisper.tried == ["int8"]
+    assert t.compute_type == "int8"
+    assert t._model.cpu_threads >= 1
+
+
+def test_whisper_reraises_when_no_compute_type_works(fake_whisper):
+    from vype.stt.whisper import WhisperTranscriber
+
+    fake_whisper.unsupported = {"int8", "float32"}
+    t = WhisperTranscriber(SttConfig(backend="whisper", device="cpu"))
+    with pytest.raises(ValueError, match="float32"):
+        t.load()
+    assert fake_whisper.tried == ["int8", "float32"]
+    assert t.compute_type is None
+    assert t._model is None
+
+
+def test_whisper_warm_up_bypasses_vad_and_bounds_decode(fake_whisper):
+    from vype.stt.whisper import WhisperTranscriber
+
+    WhisperTranscriber(SttConfig(backend="whisper", device="cpu")).load()
+    (kwargs,) = fake_whisper.transcribe_kwargs
+    assert kwargs["vad_filter"] is False
+    assert kwargs["max_new_tokens"] == 8
+    assert kwargs["without_timestamps"] is True
+
+
+def test_whisper_warm_up_failure_does_not_fail_load(fake_whisper, caplog):
+    from vype.stt.whisper import WhisperTranscriber
+
+    fake_whisper.transcribe_error = RuntimeError("cuDNN kernel init failed")
+    t = WhisperTranscriber(SttConfig(backend="whisper", device="cpu"))
+    with caplog.at_level("WARNING", logger="vype.stt.whisper"):
+        t.load()
+    assert t._model is not None
+    assert t.compute_type == "int8"
+    assert any("warm-up failed" in r.getMessage() for r in caplog.records)
+
+
+def test_whisper_tries_user_compute_type_first_without_duplicates(fake_whisper):
+    from vype.stt.whisper import WhisperTranscriber
+
+    cfg = SttConfig(backend="whisper", device="cuda", compute_type="int8")
+    fake_whisper.unsupported = {"int8"}
+    t = WhisperTranscriber(cfg)
+    t.load()
+    # user's choice first, then the ladder with int8 not retried
+    assert fake_whisper.tried == ["int8", "float16"]
+    assert t.compute_type == "float16"
+
+
+def test_whisper_warns_when_user_compute_type_is_rejected(fake_whisper, caplog):
+    from vype.stt.whisper import WhisperTranscriber
+
+    cfg = SttConfig(backend="whisper", device="cuda", compute_type="int8_float16")
+    fake_whisper.unsupported = {"int8_float16", "float16"}
+    with caplog.at_level("INFO", logger="vype.stt.whisper"):
+        WhisperTranscriber(cfg).load()
+    levels = {r.args[0]: r.levelname for r in caplog.records if "unsupported" in r.msg}
+    assert levels == {"int8_float16": "WARNING", "float16": "INFO"}
+
+
 def test_factory_routes_openai():
     cfg = SttConfig(backend="openai", base_url="http://x/v1", api_key="k")
     t = create_transcriber(cfg)